@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Shared Playwright fixtures for the ELSA UI tests
+
+Requires: pip install pytest-playwright pytest-xdist pillow && playwright install chromium
+Run with: pytest -n 3 --dist=loadfile test_ui.py test_ui_simple.py test_ui_manual_login.py
+
+Each xdist worker owns its own browser process, so the UI flows run in
+parallel instead of paying three browser cold-starts back to back.
+"""
+
+import os
+import pytest
+from testutils import CHROMIUM_ARGS, DEFAULT_TIMEOUT, VIEWPORT
+
+AUTH_STATE = os.path.join('.auth', 'elsa.json')
+
+
+@pytest.fixture(scope='session')
+def browser_type_launch_args(browser_type_launch_args):
+    launch_args = {
+        **browser_type_launch_args,
+        'args': [*browser_type_launch_args.get('args', []), *CHROMIUM_ARGS],
+    }
+    # ELSA_HEADFUL=1 works like --headed
+    if os.getenv('ELSA_HEADFUL') == '1':
+        launch_args['headless'] = False
+    return launch_args
+
+
+@pytest.fixture(scope='session')
+def browser_context_args(browser_context_args):
+    return {**browser_context_args, 'viewport': VIEWPORT}
+
+
+@pytest.fixture
+def page(page):
+    page.set_default_timeout(DEFAULT_TIMEOUT)
+    return page
+
+
+@pytest.fixture(scope='session')
+def auth_state():
+    """Path of the login session saved by test_ui_manual_login.py."""
+    return AUTH_STATE
@@ -112,6 +112,7 @@ export default function ChatSidebar({ currentSessionId, onSessionSelect, onNewCh
 
   return (
     <div
+      data-testid="chat-sidebar"
       className="bg-[#1a1a1a]/95 border-r-2 border-white/[0.1] flex flex-col flex-shrink-0 h-full transition-[width] duration-300 ease-[cubic-bezier(0.4,0,0.2,1)] overflow-hidden shadow-[4px_0_24px_-2px_rgba(0,0,0,0.8)]"
       style={{ width: isOpen ? 280 : 0 }}
     >
@@ -43,7 +43,7 @@ export default function LoginPage() {
         <p style={{ fontSize: '10px', color: 'rgba(255,255,255,0.2)', marginBottom: '28px', animation: 'fadeIn 0.5s ease-out 0.25s both' }}>Analyze ETH & BTC wallets. Spot patterns. Detect anomalies.</p>
 
         {/* Feature cards */}
-        <div className="flex justify-center" style={{ gap: '14px', marginBottom: '28px' }}>
+        <div role="list" aria-label="features" className="flex justify-center" style={{ gap: '14px', marginBottom: '28px' }}>
           {[
             { icon: Scan, color: '#10b981', glow: 'rgba(16,185,129,0.08)', title: 'Deep Analysis', desc: 'Transaction history & patterns', delay: '0.3s' },
             { icon: TrendingUp, color: '#14b8a6', glow: 'rgba(20,184,166,0.08)', title: 'Visual Charts', desc: 'Interactive data visualization', delay: '0.38s' },
@@ -51,6 +51,7 @@ export default function LoginPage() {
           ].map((card) => (
             <div
               key={card.title}
+              role="listitem"
               className="flex flex-col items-center backdrop-blur-sm cursor-default transition-all duration-300"
               style={{
                 width: '110px',
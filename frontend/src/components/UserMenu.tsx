@@ -17,6 +17,8 @@ export default function UserMenu() {
       <span className="text-white/30 truncate flex-1" style={{ fontSize: '11px' }}>{user.name}</span>
       <span
         onClick={logout}
+        role="button"
+        aria-label="Logout"
         className="text-white/15 hover:text-white/40 cursor-pointer transition-all duration-200 opacity-0 group-hover/user:opacity-100"
       >
         <LogOut style={{ width: '12px', height: '12px' }} strokeWidth={1.5} />
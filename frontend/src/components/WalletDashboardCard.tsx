@@ -165,6 +165,7 @@ export default function WalletDashboardCard({ address, stats, summary, isLoading
   return (
     <div
       ref={cardRef}
+      data-testid="wallet-dashboard-card"
       style={{
         borderRadius: '16px',
         backgroundColor: 'rgba(255,255,255,0.02)',
@@ -225,7 +226,7 @@ export default function WalletDashboardCard({ address, stats, summary, isLoading
         <div style={{ height: '1px', background: 'linear-gradient(90deg, transparent, rgba(255,255,255,0.04) 50%, transparent)', marginBottom: '14px' }} />
 
         {/* Stats row */}
-        <div style={{ display: 'grid', gridTemplateColumns: 'repeat(3, 1fr)', gap: '12px' }}>
+        <div data-testid="wallet-stats" style={{ display: 'grid', gridTemplateColumns: 'repeat(3, 1fr)', gap: '12px' }}>
           {[
             {
               icon: <Activity style={{ width: '12px', height: '12px', color: 'rgba(16,185,129,0.4)' }} strokeWidth={1.5} />,
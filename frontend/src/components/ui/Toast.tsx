@@ -38,6 +38,7 @@ function ToastItem({ toast }: { toast: ToastType }) {
 
   return (
     <div
+      data-testid={`toast-${toast.type}`}
       style={{
         display: 'flex',
         alignItems: 'center',
@@ -1,208 +1,59 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Test ELSA UI after manual login - Comprehensive verification"""
+"""Test ELSA UI after manual login - Comprehensive verification
 
-import sys
-import io
-from playwright.sync_api import sync_playwright
-import time
-
-# Fix Windows console encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-def test_ui_after_login():
-    with sync_playwright() as p:
-        # Launch Brave browser
-        print("\n[INFO] Launching Brave browser...")
-
-        browser = p.chromium.launch(
-            headless=False,
-            executable_path='C:/Program Files/BraveSoftware/Brave-Browser/Application/brave.exe'
-        )
-
-        context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-        page = context.new_page()
-
-        print("\n" + "=" * 70)
-        print("ELSA UI VERIFICATION TEST - Manual Login Required")
-        print("=" * 70)
-
-        # Navigate to the app
-        page.goto('http://localhost:5173')
-        page.wait_for_load_state('networkidle')
-
-        print("\n[STEP 1] Waiting for you to login with Google...")
-        print("          Please login manually in the browser window")
-        print("          The test will automatically continue after login...")
-
-        # Wait for login to complete (detect when we're past login page)
-        try:
-            # Wait for either the input field (logged in) or timeout after 120 seconds
-            page.wait_for_selector('textarea[placeholder*="wallet"]', timeout=120000)
-            print("\n[SUCCESS] Login detected! Starting verification...")
-            time.sleep(2)
-        except:
-            print("\n[ERROR] Login timeout. Please run the test again and login within 2 minutes.")
-            browser.close()
-            return
-
-        print("\n" + "=" * 70)
-        print("RUNNING AUTOMATED VERIFICATION TESTS")
-        print("=" * 70)
-
-        # TEST 1: Feature Cards Layout
-        print("\n[TEST 1/6] Checking Feature Cards are Horizontal...")
-        feature_grid = page.locator('.grid.grid-cols-3').first
-        if feature_grid.is_visible():
-            deep_analysis = page.locator('text=Deep Analysis')
-            visual_charts = page.locator('text=Visual Charts')
-            realtime = page.locator('text=Real-time Insights')
-
-            if deep_analysis.is_visible() and visual_charts.is_visible() and realtime.is_visible():
-                print("          [PASS] All 3 feature cards visible")
-                print("          [PASS] Using grid-cols-3 (horizontal layout)")
-                page.screenshot(path='screenshots/verify-01-feature-cards.png')
-                print("          Screenshot: screenshots/verify-01-feature-cards.png")
-            else:
-                print("          [FAIL] Not all feature cards visible")
-        else:
-            print("          [FAIL] Feature cards grid not found")
-
-        # TEST 2: Account Section Position
-        print("\n[TEST 2/6] Checking Account Section is Pinned to Bottom...")
-        try:
-            # Check if UserMenu parent has mt-auto class
-            user_section = page.locator('.mt-auto').filter(has=page.locator('text=Logout'))
-            if user_section.count() > 0:
-                print("          [PASS] Account section uses mt-auto (pinned to bottom)")
+Run with: pytest -s test_ui_manual_login.py
 
-                # Take screenshot of sidebar
-                page.screenshot(path='screenshots/verify-02-sidebar-account.png', clip={'x': 0, 'y': 0, 'width': 300, 'height': 1080})
-                print("          Screenshot: screenshots/verify-02-sidebar-account.png")
-            else:
-                print("          [INFO] Checking if account is at bottom visually...")
-        except:
-            print("          [INFO] Account section structure changed")
+The first run waits for a manual Google login and saves the session to
+.auth/elsa.json; later runs reuse it. Delete that file to login again.
+"""
 
-        # TEST 3: Invalid Wallet Toast Color
-        print("\n[TEST 3/6] Testing Toast Colors (Invalid Wallet)...")
-        input_field = page.locator('textarea[placeholder*="wallet"]').first
-
-        print("          Entering invalid wallet: 0xinvalid")
-        input_field.fill('0xinvalid')
-        page.keyboard.press('Enter')
-        time.sleep(1.5)
-
-        # Check for warning toast
-        toast = page.locator('[class*="border-\\[\\#f59e0b\\]"]')
-        if toast.count() > 0:
-            print("          [PASS] Warning toast has correct orange color (#f59e0b)")
-            page.screenshot(path='screenshots/verify-03-warning-toast.png')
-            print("          Screenshot: screenshots/verify-03-warning-toast.png")
-        else:
-            print("          [INFO] Toast might be using different color format")
-            page.screenshot(path='screenshots/verify-03-toast-check.png')
-            print("          Screenshot: screenshots/verify-03-toast-check.png")
-
-        time.sleep(2)
-
-        # TEST 4: Loading State Visibility
-        print("\n[TEST 4/6] Testing Loading State Visibility...")
-        input_field.fill('')
-        input_field.fill('1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
-
-        print("          Submitting valid wallet to trigger loading state...")
-        page.keyboard.press('Enter')
-        time.sleep(0.3)
-
-        # Check for loading skeleton
-        loading = page.locator('.animate-pulse').first
-        if loading.is_visible():
-            print("          [PASS] Loading skeleton is visible")
-            page.screenshot(path='screenshots/verify-04-loading-state.png', full_page=True)
-            print("          Screenshot: screenshots/verify-04-loading-state.png")
-        else:
-            print("          [INFO] Loading state might have finished too quickly")
-            time.sleep(0.5)
-            page.screenshot(path='screenshots/verify-04-check.png', full_page=True)
-
-        # TEST 5: Success Toast Color
-        print("\n[TEST 5/6] Waiting for Success Toast...")
-        time.sleep(4)
-
-        success_toast = page.locator('[class*="border-\\[\\#10b981\\]"]')
-        if success_toast.count() > 0:
-            print("          [PASS] Success toast has correct green color (#10b981)")
-            page.screenshot(path='screenshots/verify-05-success-toast.png')
-            print("          Screenshot: screenshots/verify-05-success-toast.png")
-        else:
-            print("          [INFO] Checking for any toast...")
-            page.screenshot(path='screenshots/verify-05-response.png', full_page=True)
-            print("          Screenshot: screenshots/verify-05-response.png")
-
-        time.sleep(1)
+import os
+import sys
+import pytest
+from elsa_ui_test import run
+from testutils import DEFAULT_TIMEOUT, VIEWPORT, brave_executable
 
-        # TEST 6: WalletDashboardCard Layout
-        print("\n[TEST 6/6] Checking WalletDashboardCard Stats are Horizontal...")
-        wallet_card = page.locator('text=Wallet Address').first
 
-        if wallet_card.is_visible():
-            print("          [PASS] WalletDashboardCard is visible")
+@pytest.fixture(scope='session')
+def brave_headless(browser_type_launch_args, auth_state):
+    # Stay headed until a login session has been saved
+    return browser_type_launch_args.get('headless', True) and os.path.exists(auth_state)
 
-            # Check if stats use grid-cols-3
-            stats_grid = page.locator('text=Transactions').locator('..').locator('..').locator('..')
 
-            # Check if all three stats are visible
-            transactions = page.locator('text=Transactions')
-            risk_score = page.locator('text=Risk Score')
-            last_activity = page.locator('text=Last Activity')
+@pytest.fixture(scope='session')
+def brave_browser(browser_type, browser_type_launch_args, brave_headless):
+    """Brave (or bundled Chromium), headed only while a manual login is needed."""
+    launch_args = {**browser_type_launch_args, 'headless': brave_headless}
 
-            if transactions.is_visible() and risk_score.is_visible() and last_activity.is_visible():
-                print("          [PASS] All 3 stats visible (Transactions | Risk Score | Last Activity)")
-                print("          [PASS] Stats using grid-cols-3 (horizontal layout)")
-            else:
-                print("          [INFO] Not all stats visible")
+    brave_path = brave_executable()
+    if brave_path:
+        # Launch Brave browser
+        print("\n[INFO] Launching Brave browser...")
+        launch_args['executable_path'] = brave_path
+    else:
+        print("\n[INFO] Brave browser not found, using bundled Chromium...")
+    browser = browser_type.launch(**launch_args)
+    yield browser
+    browser.close()
 
-            page.screenshot(path='screenshots/verify-06-wallet-card.png', full_page=True)
-            print("          Screenshot: screenshots/verify-06-wallet-card.png")
-        else:
-            print("          [FAIL] WalletDashboardCard not found")
 
-        # Final full page screenshot
-        print("\n[FINAL] Taking full page screenshot...")
-        page.screenshot(path='screenshots/verify-07-final-full-page.png', full_page=True)
-        print("        Screenshot: screenshots/verify-07-final-full-page.png")
+@pytest.fixture
+def page(brave_browser, auth_state):
+    """Page in a context that reuses the saved login session, if any."""
+    context_args = {'viewport': VIEWPORT}
+    if os.path.exists(auth_state):
+        context_args['storage_state'] = auth_state
+    context = brave_browser.new_context(**context_args)
+    page = context.new_page()
+    page.set_default_timeout(DEFAULT_TIMEOUT)
+    yield page
+    context.close()
 
-        # Summary
-        print("\n" + "=" * 70)
-        print("VERIFICATION COMPLETE!")
-        print("=" * 70)
-        print("\nAll screenshots saved to screenshots/ folder:")
-        print("  1. verify-01-feature-cards.png     - Feature cards horizontal layout")
-        print("  2. verify-02-sidebar-account.png   - Account pinned to bottom")
-        print("  3. verify-03-warning-toast.png     - Orange warning toast color")
-        print("  4. verify-04-loading-state.png     - Loading skeleton visibility")
-        print("  5. verify-05-success-toast.png     - Green success toast color")
-        print("  6. verify-06-wallet-card.png       - WalletDashboardCard horizontal stats")
-        print("  7. verify-07-final-full-page.png   - Complete page state")
-        print("\n" + "=" * 70)
 
-        # Keep browser open for manual inspection
-        print("\n[WAIT] Browser will stay open for 15 seconds for manual inspection...")
-        time.sleep(15)
+def test_ui_after_login(page, auth_state, brave_headless):
+    run(page, 'manual_login', auth_state=auth_state, headless=brave_headless)
 
-        browser.close()
 
 if __name__ == '__main__':
-    import os
-    os.makedirs('screenshots', exist_ok=True)
-
-    # Check if Brave exists
-    import os.path
-    brave_path = 'C:/Program Files/BraveSoftware/Brave-Browser/Application/brave.exe'
-    if not os.path.exists(brave_path):
-        print("\n[ERROR] Brave browser not found at:", brave_path)
-        print("        Please update the path in the script")
-        sys.exit(1)
-
-    test_ui_after_login()
+    sys.exit(pytest.main([__file__, '-s']))
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Helpers shared by the ELSA UI tests"""
+
+import functools
+import io
+import os
+import pathlib
+import shutil
+import sys
+from PIL import Image
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+APP_URL = 'http://localhost:5173'
+BRAVE_WINDOWS_PATH = 'C:/Program Files/BraveSoftware/Brave-Browser/Application/brave.exe'
+
+# Bounds how long any single missing element can stall a test
+DEFAULT_TIMEOUT = 5000
+
+# Functional steps and component shots render at the smaller size; only
+# the final full-page summary needs the full HD viewport
+VIEWPORT = {'width': 1280, 'height': 800}
+SUMMARY_VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Chromium flags that strip paint and scheduling cost on CI
+CHROMIUM_ARGS = [
+    '--force-device-scale-factor=1',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+]
+
+
+@functools.cache
+def _bootstrap():
+    """One-time process setup shared by every UI test module."""
+    # Fix Windows console encoding without replacing pytest's capture stream
+    if sys.stdout.encoding.lower() != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    pathlib.Path('screenshots').mkdir(exist_ok=True)
+
+
+@functools.cache
+def brave_executable():
+    """Path to a Brave install, or None to use Playwright's bundled Chromium."""
+    for name in ('brave', 'brave-browser'):
+        path = shutil.which(name)
+        if path:
+            return path
+    if os.path.exists(BRAVE_WINDOWS_PATH):
+        return BRAVE_WINDOWS_PATH
+    return None
+
+
+def open_app(page):
+    """Open the app and wait for its first actionable element.
+
+    Waiting on networkidle never settles cleanly on the SPA, so wait for
+    either the wallet input (logged in) or the Google login button.
+    """
+    page.goto(APP_URL, wait_until='domcontentloaded')
+    wallet_input = page.locator('textarea[placeholder*="wallet"]')
+    login_button = page.get_by_text('Continue with Google')
+    wallet_input.or_(login_button).first.wait_for(state='visible', timeout=10000)
+
+
+def _path(name, quality):
+    return f"screenshots/{name}.{'jpg' if quality else 'png'}"
+
+
+def wait_for_paint(page):
+    """Wait until the browser has painted the next frame.
+
+    This only flushes pending DOM changes to the screen; it does not wait
+    for CSS transitions to end, which capture() handles by disabling
+    animations. requestAnimationFrame never fires in a hidden or minimized
+    headed window, so give up after 100ms rather than hanging the capture.
+    """
+    page.evaluate('''() => new Promise(r => {
+        requestAnimationFrame(() => requestAnimationFrame(r));
+        setTimeout(r, 100);
+    })''')
+
+
+def capture(page, name, quality=None):
+    """Take one full-page screenshot, save it and return it for cropping.
+
+    Pass a JPEG `quality` for throwaway shots that are only eyeballed; it
+    encodes far faster than PNG. Keep PNG where pixel diffs are planned.
+    Pass name=None to only return the image without saving it.
+
+    CSS animations are fast-forwarded to their end state, so a shot taken
+    right after a page load does not catch the fade-ins half way.
+    """
+    wait_for_paint(page)
+    if quality:
+        data = page.screenshot(full_page=True, type='jpeg', quality=quality, animations='disabled')
+    else:
+        data = page.screenshot(full_page=True, type='png', animations='disabled')
+    # Write the browser's bytes as-is rather than re-encoding them
+    if name is not None:
+        with open(_path(name, quality), 'wb') as f:
+            f.write(data)
+    return Image.open(io.BytesIO(data))
+
+
+def crop(img, box, name, quality=None):
+    """Save the region of a full-page capture covered by a bounding box.
+
+    `box` uses the {'x', 'y', 'width', 'height'} shape returned by
+    locator.bounding_box(), so regions cost one CDP call instead of a
+    second screenshot. `quality` works as in capture().
+
+    The box is clamped to the image, since an element scrolled inside a
+    container can reach past it. Returns None, saving nothing, when the
+    box is None (element not rendered) or lies entirely outside.
+    """
+    if box is None:
+        return None
+    left = max(0, int(box['x']))
+    top = max(0, int(box['y']))
+    right = min(img.width, int(box['x'] + box['width']))
+    bottom = min(img.height, int(box['y'] + box['height']))
+    if right <= left or bottom <= top:
+        return None
+
+    region = img.crop((left, top, right, bottom))
+    if quality:
+        region.convert('RGB').save(_path(name, quality), 'JPEG', quality=quality)
+    else:
+        region.save(_path(name, quality), 'PNG')
+    return region
+
+
+def is_present(locator, timeout=1000):
+    """Wait briefly for `locator` to be visible, returning False on a miss."""
+    try:
+        locator.wait_for(state='visible', timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_animations(locator):
+    """Wait for the CSS animations and transitions in `locator` to end.
+
+    Screenshots fast-forward them, but bounding_box() measures the live
+    page, so call this before cropping an element that slides or resizes.
+    """
+    locator.evaluate("el => Promise.all(el.getAnimations({subtree: true}).map(a => a.finished))")
+
+
+def assert_in_a_row(*locators):
+    """Assert the elements sit side by side, left to right, on one row.
+
+    Compares bounding boxes rather than class names, so it checks the
+    layout the user sees whatever CSS produced it.
+    """
+    boxes = [locator.bounding_box() for locator in locators]
+    assert all(boxes), "Not all elements are rendered"
+    first = boxes[0]
+    for prev, box in zip(boxes, boxes[1:]):
+        assert abs(box['y'] - first['y']) < first['height'] / 2, f"Elements are not on one row: {boxes}"
+        assert box['x'] >= prev['x'] + prev['width'], f"Elements are not left to right: {boxes}"
+
+
+_bootstrap()